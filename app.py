@@ -5,7 +5,17 @@ Book QR Generator - A lightweight desktop application for generating QR codes fr
 
 import sys
 import os
+import hashlib
+import mmap
 import re
+import shutil
+import struct
+import threading
+import time
+import zlib
+import queue
+from collections import OrderedDict
+from importlib.util import find_spec
 from io import BytesIO
 
 # Check for required dependencies with helpful error messages
@@ -25,26 +35,53 @@ except ImportError:
     print("  • Windows: tkinter is included with standard Python installation")
     sys.exit(1)
 
-try:
-    from pypdf import PdfReader
-except ImportError:
+
+def module_available(name):
+    """
+    Check whether a module can be imported without actually importing it.
+    
+    Args:
+        name: Module name
+    
+    Returns:
+        True if the module is installed
+    """
     try:
-        from PyPDF2 import PdfReader
-    except ImportError:
-        missing_dependencies.append("pypdf (or PyPDF2)")
+        return find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
 
-try:
-    import qrcode
-except ImportError:
+
+# The heavy modules below are only looked up here and imported on first use,
+# so the window appears without paying their import cost.
+
+# PyMuPDF is the preferred PDF backend (much faster text extraction);
+# pypdf/PyPDF2 is used as a fallback when PyMuPDF is not installed.
+HAS_PYMUPDF = module_available("pymupdf") or module_available("fitz")
+HAS_PYPDF = module_available("pypdf") or module_available("PyPDF2")
+
+if not HAS_PYMUPDF and not HAS_PYPDF:
+    missing_dependencies.append("PyMuPDF (or pypdf)")
+
+# segno is the preferred QR encoder (much faster mask evaluation);
+# qrcode is used as a fallback when segno is not installed.
+HAS_SEGNO = module_available("segno")
+
+if not HAS_SEGNO and not module_available("qrcode"):
     missing_dependencies.append("qrcode[pil]")
 
-try:
-    from PIL import Image, ImageTk
-except ImportError:
+# ImageTk is looked up too: some distributions package it separately, and
+# without it no preview can be shown
+if not module_available("PIL.ImageTk"):
     # Only add Pillow if qrcode is already satisfied (since qrcode[pil] includes Pillow)
     if "qrcode[pil]" not in missing_dependencies:
         missing_dependencies.append("Pillow")
 
+# Optional: NumPy speeds up turning the QR matrix into an image on CPython.
+# On PyPy the pure Python path is JIT compiled and beats NumPy's wrappers,
+# so NumPy is not used there.
+HAS_NUMPY = module_available("numpy") and sys.implementation.name != "pypy"
+
 # If any dependencies are missing, provide helpful error message
 if missing_dependencies:
     print("\n❌ ERROR: Required Python packages are not installed.\n")
@@ -54,12 +91,589 @@ if missing_dependencies:
     print("\n📦 To install all required dependencies, run:")
     print("     pip install -r requirements.txt")
     print("\nOr install individually:")
-    print("     pip install pypdf qrcode[pil]")
+    print("     pip install PyMuPDF qrcode[pil]")
     print("\n💡 Note: qrcode[pil] includes Pillow for image support.")
     print("💡 Make sure you're in the book-qr-generator directory.\n")
     sys.exit(1)
 
 
+def import_pymupdf():
+    """Import and return the PyMuPDF module."""
+    try:
+        import pymupdf as fitz
+    except ImportError:
+        import fitz  # Older PyMuPDF releases
+    return fitz
+
+
+def import_pdf_reader():
+    """Import and return the pypdf (or PyPDF2) PdfReader class."""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        from PyPDF2 import PdfReader
+    return PdfReader
+
+
+def open_pdf_reader(pdf_path):
+    """
+    Open a PDF file with pypdf (or PyPDF2) through a read-only memory map.
+    
+    Given a path, PdfReader reads the whole file into memory up front. A
+    memory map lets it seek and read directly from the OS page cache
+    instead, so only the parts of the file that are used are loaded.
+    
+    Reading a mapped file that has been truncated since it was mapped kills
+    the process (SIGBUS), so this is only meant for readers that are closed
+    as soon as their pages are extracted. Readers kept open while the user
+    works should read the file into memory instead.
+    
+    Args:
+        pdf_path: Path to the PDF file
+    
+    Returns:
+        PdfReader reading from the memory map; close its stream to unmap it
+    """
+    PdfReader = import_pdf_reader()
+    with open(pdf_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped; let PdfReader report them
+            return PdfReader(f)
+        # The map stays valid after the file is closed
+        pdf_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return PdfReader(pdf_map)
+    except Exception:
+        pdf_map.close()
+        raise
+
+
+def extract_pages_in_process(task):
+    """
+    Extract the raw text of a batch of pages in a worker process.
+    
+    Documents cannot be shared with other processes, so each batch opens
+    the PDF itself. This is a module-level function so it can be pickled.
+    
+    Args:
+        task: Tuple of (backend, pdf_path, page_numbers) where backend is
+            "fitz" or "pypdf" and page numbers are 1-indexed
+    
+    Returns:
+        List of page texts in the same order as page_numbers
+    """
+    backend, pdf_path, page_numbers = task
+    
+    if backend == "fitz":
+        with import_pymupdf().open(pdf_path) as doc:
+            return [doc.load_page(p - 1).get_text("text") for p in page_numbers]
+    
+    reader = open_pdf_reader(pdf_path)
+    try:
+        return [reader.pages[p - 1].extract_text() or "" for p in page_numbers]
+    finally:
+        reader.stream.close()
+
+
+class LRUCache(OrderedDict):
+    """Dictionary holding at most maxsize entries, evicting the least recently used."""
+    
+    def __init__(self, maxsize):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            maxsize: Maximum number of entries to keep
+        """
+        super().__init__()
+        self.maxsize = maxsize
+    
+    def get(self, key, default=None):
+        """Return the value for key (marking it as recently used), or default."""
+        if key in self:
+            self.move_to_end(key)
+            return self[key]
+        return default
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+# Maximum number of pages whose extracted text is kept in memory
+PAGE_TEXT_CACHE_SIZE = 512
+
+# With PyMuPDF, ranges with at least this many uncached pages are extracted
+# in worker processes; below that, starting the processes costs more than it
+# saves, since PyMuPDF extracts a page in milliseconds.
+PROCESS_POOL_MIN_PAGES_FITZ = 200
+
+# Approximate pypdf costs (ms) used to decide whether worker processes pay
+# off, measured on a 1,500 page book: extracting one page with the loaded
+# reader, parsing the document again in a worker (per page of the document,
+# since pypdf reads the whole page tree), and starting the pool
+PYPDF_PAGE_EXTRACT_MS = 8
+PYPDF_PAGE_PARSE_MS = 0.4
+PROCESS_POOL_STARTUP_MS = 300
+
+# Page range input such as "10-15"
+_RANGE_RE = re.compile(r'^(\d+)\s*-\s*(\d+)$')
+
+# Largest QR code preview that fits the 400x400 canvas with some padding
+PREVIEW_MAX_SIZE = 380
+
+# Module size in pixels used for saved QR code images
+SAVE_BOX_SIZE = 10
+
+# Write buffer size for QR code images saved through Pillow
+SAVE_BUFFER_SIZE = 1 << 20
+
+# Runs of digits or uppercase alphanumerics at least this long are encoded in
+# the denser numeric/alphanumeric QR modes instead of byte mode (qrcode only)
+QR_SEGMENT_MIN_LENGTH = 20
+
+# Byte mode capacity of the largest QR code (version 40) at error level L
+QR_MAX_BYTES = 2953
+
+# Quiet zone width in modules of QR codes stored by encode_qr_matrix_cached()
+QR_CACHE_BORDER = 4
+
+# Separator between the extracted text and the Google Drive link
+DRIVE_LINK_PREFIX = "\n\n---\nGoogle Drive Link: "
+
+# Directory holding results kept across sessions: previously encoded QR codes
+# (see encode_qr_matrix_cached()) and extracted page text per PDF file. It is
+# private to the current user, since it holds the text of the user's books.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".bookqr_cache")
+QR_CACHE_DIR = os.path.join(CACHE_DIR, "qr")
+TEXT_CACHE_DIR = os.path.join(CACHE_DIR, "text")
+
+# Cached QR codes and PDF text that have not been used for this long (seconds)
+# are removed; every preview and every modification of a PDF adds new entries
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# Hint shown in the empty URL/text input
+URL_PLACEHOLDER = "https://example.com or any text"
+
+# How long (ms) the "Saved: ..." status stays visible after saving
+SAVE_STATUS_TIMEOUT_MS = 4000
+
+# Delay (ms) after the last keystroke before the character count is updated
+CHAR_COUNT_DELAY_MS = 100
+
+
+# Error correction level by encoded content size: (maximum UTF-8 bytes, level).
+# Short content gets the strongest correction since it stays a small code
+# anyway; longer content trades correction for capacity so it still fits.
+# Each tier is well within the byte mode capacity of its level, so anything
+# that fits at level L also fits at the level chosen here.
+ERROR_CORRECTION_TIERS = ((100, "H"), (400, "Q"), (1000, "M"))
+
+
+def pick_error_correction(length):
+    """
+    Choose a QR code error correction level for content of a given size.
+    
+    QR code capacity is measured in encoded bytes, so the size must be the
+    UTF-8 encoded length rather than the number of characters.
+    
+    Args:
+        length: Size of the content in UTF-8 bytes
+    
+    Returns:
+        Error correction level ("L", "M", "Q" or "H")
+    """
+    for max_length, error in ERROR_CORRECTION_TIERS:
+        if length <= max_length:
+            return error
+    return "L"
+
+
+class DataOverflowError(ValueError):
+    """Raised when content is too large to fit in a QR code."""
+
+
+def encode_qr_matrix(content, error, border=4):
+    """
+    Encode content into a QR code module matrix.
+    
+    segno is used when installed; otherwise qrcode is used. The smallest
+    QR code version that fits the content is chosen automatically.
+    
+    Args:
+        content: Text to encode
+        error: Error correction level ("L", "M", "Q" or "H")
+        border: Width of the quiet zone in modules
+    
+    Returns:
+        List of rows (border included), each a sequence of module values
+        where a true value is a dark module
+    
+    Raises:
+        DataOverflowError: If the content does not fit in a QR code
+    """
+    if HAS_SEGNO:
+        import segno
+        
+        try:
+            qr = segno.make(content, error=error, micro=False)
+        except segno.DataOverflowError as e:
+            raise DataOverflowError(str(e)) from e
+        return [list(row) for row in qr.matrix_iter(border=border)]
+    
+    import qrcode
+    
+    qr = qrcode.QRCode(
+        version=None,  # Auto-size
+        error_correction=getattr(qrcode.constants, f"ERROR_CORRECT_{error}"),
+        border=border,
+    )
+    qr.add_data(content, optimize=QR_SEGMENT_MIN_LENGTH)
+    try:
+        qr.make(fit=True)
+    except (qrcode.exceptions.DataOverflowError, ValueError) as e:
+        # Newer qrcode releases report content that does not fit in
+        # version 40 as an invalid version instead of DataOverflowError
+        raise DataOverflowError(str(e)) from e
+    return qr.get_matrix()
+
+
+# PNG file signature and the (constant) image end chunk
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_IEND = struct.pack(">I", 0) + b"IEND" + struct.pack(">I", zlib.crc32(b"IEND"))
+
+
+def _png_chunk(chunk_type, data):
+    """Build a PNG chunk: length, type, data and CRC-32 of type and data."""
+    crc = zlib.crc32(data, zlib.crc32(chunk_type))
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+
+def qr_to_png_bytes(matrix, box_size):
+    """
+    Encode a QR code module matrix directly as a 1-bit grayscale PNG.
+    
+    This skips building an image in Pillow and running its PNG encoder.
+    Every module row becomes box_size identical scanlines, so each distinct
+    row is only packed once.
+    
+    Args:
+        matrix: Module matrix as returned by encode_qr_matrix()
+        box_size: Size of each module in pixels
+    
+    Returns:
+        PNG file contents
+    """
+    size = len(matrix) * box_size
+    padding = "1" * (-size % 8)
+    
+    scanlines = []
+    for row in matrix:
+        # Bit 1 is white; filter type 0 (none) precedes every scanline
+        bits = "".join(("0" if module else "1") * box_size for module in row) + padding
+        scanline = b"\x00" + int(bits, 2).to_bytes(len(bits) // 8, "big")
+        scanlines.append(scanline * box_size)
+    
+    # Width, height, bit depth 1, color type 0 (grayscale), default
+    # compression, filter and interlace methods
+    header = struct.pack(">IIBBBBB", size, size, 1, 0, 0, 0, 0)
+    return b"".join((
+        _PNG_SIGNATURE,
+        _png_chunk(b"IHDR", header),
+        # The default level is barely slower than level 1 on these
+        # repetitive scanlines but makes files about three times smaller
+        _png_chunk(b"IDAT", zlib.compress(b"".join(scanlines))),
+        _PNG_IEND,
+    ))
+
+
+def render_preview_image(matrix):
+    """
+    Render a QR code module matrix at the size shown on the canvas.
+    
+    The preview is rendered with a module size that already fits the
+    canvas, so it never has to be downscaled. The full size image is
+    only rendered when the QR code is saved.
+    
+    Args:
+        matrix: Module matrix as returned by encode_qr_matrix()
+    
+    Returns:
+        QR code image no larger than PREVIEW_MAX_SIZE
+    """
+    preview_box_size = max(1, PREVIEW_MAX_SIZE // len(matrix))
+    return render_qr_image(matrix, preview_box_size)
+
+
+def render_qr_image(matrix, box_size):
+    """
+    Render a QR code module matrix as an image.
+    
+    Args:
+        matrix: Module matrix as returned by encode_qr_matrix()
+        box_size: Size of each module in pixels
+    
+    Returns:
+        QR code image
+    """
+    from PIL import Image
+    
+    # Scale the module matrix (border included) up in bulk instead of
+    # drawing every module separately
+    if HAS_NUMPY:
+        import numpy as np
+        
+        modules = np.asarray(matrix, dtype=bool)
+        pixels = (~modules).repeat(box_size, axis=0).repeat(box_size, axis=1)
+        return Image.fromarray(pixels)
+    
+    # One byte per pixel: 0 is a dark module, 255 a light one
+    dark = b"\x00" * box_size
+    light = b"\xff" * box_size
+    pixels = b"".join(
+        b"".join(dark if module else light for module in row) * box_size
+        for row in matrix
+    )
+    size = len(matrix) * box_size
+    return Image.frombytes("1", (size, size), pixels, "raw", "1;8")
+
+
+def encode_qr_matrix_cached(content, error):
+    """
+    Encode content into a QR code module matrix, reusing earlier results.
+    
+    Matrices are stored in QR_CACHE_DIR as PNG files with one pixel per
+    module, named by a hash of the error correction level and content, so
+    generating the same QR code again (even after a restart) only reads a
+    small file. The cache is best effort: unreadable entries and images that
+    are not a valid QR code size are encoded again, and write failures are
+    ignored.
+    
+    Args:
+        content: Text to encode
+        error: Error correction level ("L", "M", "Q" or "H")
+    
+    Returns:
+        Module matrix as returned by encode_qr_matrix()
+    
+    Raises:
+        DataOverflowError: If the content does not fit in a QR code
+    """
+    key = hashlib.blake2b(f"{error}\0{content}".encode("utf-8"), digest_size=16).hexdigest()
+    cache_path = os.path.join(QR_CACHE_DIR, f"{key}.png")
+    
+    if os.path.exists(cache_path):
+        from PIL import Image
+        
+        try:
+            with Image.open(cache_path) as image:
+                # Only accept what qr_to_png_bytes() writes: a square 1-bit
+                # image of a valid QR code size plus the border
+                size = image.width
+                modules = size - 2 * QR_CACHE_BORDER
+                if (image.mode == "1" and image.height == size
+                        and 21 <= modules <= 177 and (modules - 21) % 4 == 0):
+                    pixels = list(image.convert("L").getdata())
+                    # Mark the entry as used so prune_caches() keeps it
+                    os.utime(cache_path)
+                    # Dark modules are black pixels
+                    return [[pixel == 0 for pixel in pixels[i:i + size]] for i in range(0, len(pixels), size)]
+        except Exception:
+            pass
+    
+    matrix = encode_qr_matrix(content, error, border=QR_CACHE_BORDER)
+    write_cache_file(cache_path, qr_to_png_bytes(matrix, 1))
+    return matrix
+
+
+def make_private_dirs(path):
+    """
+    Create a directory and any missing parents, accessible only to the user.
+    
+    Unlike os.makedirs(), which only applies the mode to the last directory,
+    every directory created here gets mode 0o700.
+    
+    Args:
+        path: Directory path
+    """
+    if os.path.isdir(path):
+        return
+    parent = os.path.dirname(path)
+    if parent != path:
+        make_private_dirs(parent)
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+
+
+def write_cache_file(cache_path, data):
+    """
+    Store data in a cache file, ignoring failures.
+    
+    The data is written to a temporary name first and then moved into
+    place, so a partially written file is never read.
+    
+    Args:
+        cache_path: Path of the cache file
+        data: File contents (bytes)
+    """
+    try:
+        make_private_dirs(os.path.dirname(cache_path))
+        temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb", opener=lambda path, flags: os.open(path, flags, 0o600)) as f:
+            f.write(data)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+
+
+def prune_cache_dir(directory, max_age):
+    """
+    Remove the entries of a cache directory that were not modified recently.
+    
+    Args:
+        directory: Cache directory; its files and subdirectories are checked
+        max_age: Maximum age in seconds
+    """
+    cutoff = time.time() - max_age
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+    
+    for entry in entries:
+        try:
+            if entry.stat(follow_symlinks=False).st_mtime >= cutoff:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def prune_caches():
+    """Remove cached QR codes and PDF text not used within CACHE_MAX_AGE."""
+    prune_cache_dir(QR_CACHE_DIR, CACHE_MAX_AGE)
+    prune_cache_dir(TEXT_CACHE_DIR, CACHE_MAX_AGE)
+
+
+class QRPreview:
+    """
+    QR code preview on a canvas, drawn into a single reusable PhotoImage.
+    
+    The PhotoImage and its canvas item are created on first use and then
+    kept: new QR codes are pasted into the existing image and clearing only
+    hides it, so no Tk images or canvas items are allocated per preview.
+    The placeholder text is a single item as well, shown and hidden.
+    The canvas size is tracked through <Configure> events, and the shown
+    QR code is re-centered whenever it changes.
+    """
+    
+    def __init__(self, canvas):
+        """
+        Initialize the preview and show the placeholder text.
+        
+        Args:
+            canvas: Canvas widget to draw on
+        """
+        self.canvas = canvas
+        self.photo = None
+        self.item = None
+        # Image currently held by the photo (a reference, so its id cannot
+        # be reused by a new image) and the canvas size it was centered for
+        self.image = None
+        self.canvas_size = None
+        # Current canvas size; the default applies until the canvas is mapped
+        self.size = (400, 400)
+        
+        # Initial message on canvas
+        self.placeholder_item = self.canvas.create_text(
+            200, 200,
+            text="QR code will appear here",
+            fill="gray",
+            font=("TkDefaultFont", 12)
+        )
+        
+        self.canvas.bind("<Configure>", self.on_configure)
+    
+    def on_configure(self, event):
+        """
+        Remember the new canvas size and re-center the shown QR code.
+        
+        Args:
+            event: Tk <Configure> event of the canvas
+        """
+        if event.width <= 1 or event.height <= 1:
+            return
+        
+        self.size = (event.width, event.height)
+        if self.image is not None and self.canvas_size is not None:
+            self.show(self.image)
+    
+    def show(self, image):
+        """
+        Show a QR code image centered on the canvas.
+        
+        Showing the image that is already drawn only re-centers it, so this
+        is cheap to call whenever the canvas is resized.
+        
+        Args:
+            image: PIL image of the QR code
+        """
+        canvas_size = self.size
+        if image is self.image and canvas_size == self.canvas_size:
+            return
+        
+        from PIL import Image, ImageTk
+        
+        x = canvas_size[0] // 2
+        y = canvas_size[1] // 2
+        
+        if image is not self.image:
+            # Nearest-neighbour keeps the module edges sharp; thumbnail()
+            # only ever scales down, so canvas sized previews are used as
+            # they are
+            preview = image
+            if max(preview.size) > PREVIEW_MAX_SIZE:
+                preview = image.copy()
+                preview.thumbnail((PREVIEW_MAX_SIZE, PREVIEW_MAX_SIZE), Image.NEAREST)
+            
+            # The photo has a fixed size, so center the code on a white
+            # square of that size
+            frame = Image.new("1", (PREVIEW_MAX_SIZE, PREVIEW_MAX_SIZE), 1)
+            frame.paste(preview, ((PREVIEW_MAX_SIZE - preview.width) // 2, (PREVIEW_MAX_SIZE - preview.height) // 2))
+            
+            if self.photo is None:
+                self.photo = ImageTk.PhotoImage(frame)
+                self.item = self.canvas.create_image(x, y, image=self.photo, anchor=tk.CENTER)
+            else:
+                self.photo.paste(frame)
+        
+        # Hide placeholder text
+        self.canvas.itemconfig(self.placeholder_item, state=tk.HIDDEN)
+        
+        # Center the image
+        self.canvas.coords(self.item, x, y)
+        self.canvas.itemconfig(self.item, state=tk.NORMAL)
+        
+        self.image = image
+        self.canvas_size = canvas_size
+    
+    def show_placeholder(self):
+        """Hide the QR code and show the placeholder text instead."""
+        if self.item is not None:
+            self.canvas.itemconfig(self.item, state=tk.HIDDEN)
+        # The photo keeps its image, but it has to be shown again
+        self.canvas_size = None
+        
+        self.canvas.itemconfig(self.placeholder_item, state=tk.NORMAL)
+
+
 class BookQRGenerator:
     """Main application class for the Book QR Generator."""
     
@@ -72,21 +686,61 @@ class BookQRGenerator:
         
         # Application state for PDF mode
         self.pdf_path = None
-        self.pdf_reader = None
+        self.pdf_doc = None
+        self.pdf_backend = None
+        self.pdf_fingerprint = None
         self.total_pages = 0
+        self.qr_matrix = None
         self.qr_image = None
-        self.qr_photo = None
         self.extracted_text = ""
         self.google_drive_link = ""
         
+        # Extracted text per page number for the loaded PDF
+        self._page_text_cache = LRUCache(PAGE_TEXT_CACHE_SIZE)
+        
+        # (matrix, PNG file contents) of the last QR code saved as PNG
+        self._saved_png = None
+        
+        # Pending root.after ids that clear the save status labels
+        self._save_status_after_ids = {}
+        
+        # Results of background tasks, dispatched on the Tk thread, and
+        # whether a _poll_task_queue() call is scheduled
+        self._task_queue = queue.Queue()
+        self._pending_tasks = 0
+        self._polling = False
+        self._pdf_busy = False
+        
+        # Pending debounced QR preview (root.after id), and whether a preview
+        # was requested while a background job was running
+        self._preview_after_id = None
+        self._preview_pending = False
+        
         # Application state for URL mode
+        self.url_qr_matrix = None
         self.url_qr_image = None
-        self.url_qr_photo = None
+        self._url_is_placeholder = True
+        self._char_count_after_id = None
         self.url_input = None
         self.url_qr_label = None
         self.url_char_count_label = None
         
         self.setup_ui()
+        
+        # Expire old cache entries without delaying start-up
+        threading.Thread(target=prune_caches, daemon=True).start()
+        
+        # Release the open document on exit
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def on_close(self):
+        """Close the open PDF and destroy the main window."""
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
+        
+        self.close_pdf()
+        self.root.destroy()
     
     def setup_ui(self):
         """Set up the user interface with tabbed interface."""
@@ -134,9 +788,8 @@ class BookQRGenerator:
         pdf_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
         pdf_frame.columnconfigure(1, weight=1)
         
-        ttk.Button(pdf_frame, text="Browse PDF", command=self.browse_pdf).grid(
-            row=0, column=0, sticky=tk.W, padx=(0, 10)
-        )
+        self.browse_button = ttk.Button(pdf_frame, text="Browse PDF", command=self.browse_pdf)
+        self.browse_button.grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
         
         self.pdf_path_label = ttk.Label(pdf_frame, text="No file selected", foreground="gray")
         self.pdf_path_label.grid(row=0, column=1, sticky=(tk.W, tk.E))
@@ -154,6 +807,7 @@ class BookQRGenerator:
         self.page_entry = ttk.Entry(page_frame, width=20)
         self.page_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(10, 0))
         self.page_entry.insert(0, "1")
+        self.page_entry.bind("<KeyRelease>", self._schedule_preview)
         
         help_text = ttk.Label(
             page_frame,
@@ -173,6 +827,7 @@ class BookQRGenerator:
         
         self.drive_link_entry = ttk.Entry(link_frame)
         self.drive_link_entry.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 5))
+        self.drive_link_entry.bind("<KeyRelease>", self._schedule_preview)
         
         ttk.Button(link_frame, text="Clear Link", command=self.clear_drive_link, width=10).grid(
             row=0, column=1, sticky=tk.W
@@ -193,17 +848,23 @@ class BookQRGenerator:
         button_frame.columnconfigure(1, weight=1)
         button_frame.columnconfigure(2, weight=1)
         
-        ttk.Button(button_frame, text="Generate QR Code", command=self.generate_qr).grid(
-            row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 5)
-        )
+        self.generate_button = ttk.Button(button_frame, text="Generate QR Code", command=self.generate_qr)
+        self.generate_button.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 5))
         
-        ttk.Button(button_frame, text="Save QR Code", command=self.save_qr).grid(
-            row=0, column=1, sticky=(tk.W, tk.E), padx=(5, 5)
-        )
+        self.save_button = ttk.Button(button_frame, text="Save QR Code", command=self.save_qr)
+        self.save_button.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(5, 5))
         
-        ttk.Button(button_frame, text="Clear", command=self.clear_form).grid(
-            row=0, column=2, sticky=(tk.W, tk.E), padx=(5, 0)
-        )
+        self.clear_button = ttk.Button(button_frame, text="Clear", command=self.clear_form)
+        self.clear_button.grid(row=0, column=2, sticky=(tk.W, tk.E), padx=(5, 0))
+        
+        # Progress indicator shown while text is extracted and encoded
+        self.progress_bar = ttk.Progressbar(button_frame, mode="indeterminate")
+        self.progress_bar.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(5, 0))
+        self.progress_bar.grid_remove()
+        
+        # Result of the last save, shown inline instead of in a dialog
+        self.save_status_label = ttk.Label(button_frame, text="", foreground="green")
+        self.save_status_label.grid(row=2, column=0, columnspan=3, sticky=tk.W, pady=(5, 0))
         
         # Text Info Section
         info_frame = ttk.LabelFrame(self.pdf_tab, text="Text Information", padding="10")
@@ -222,15 +883,7 @@ class BookQRGenerator:
         # Canvas for QR code display
         self.qr_canvas = tk.Canvas(qr_frame, width=400, height=400, bg="white", relief=tk.SUNKEN, borderwidth=2)
         self.qr_canvas.grid(row=0, column=0)
-        
-        # Initial message on canvas
-        self.qr_canvas.create_text(
-            200, 200,
-            text="QR code will appear here",
-            fill="gray",
-            font=("TkDefaultFont", 12),
-            tags="placeholder"
-        )
+        self.pdf_preview = QRPreview(self.qr_canvas)
     
     def setup_url_tab(self):
         """Set up the URL to QR Code tab."""
@@ -257,8 +910,7 @@ class BookQRGenerator:
         # Text entry for URL/text input
         self.url_input = tk.Text(url_frame, height=3, wrap=tk.WORD)
         self.url_input.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
-        self.url_input.insert("1.0", "https://example.com or any text")
-        self.url_input.config(foreground="gray")
+        self.show_url_placeholder()
         
         # Bind events for placeholder behavior
         self.url_input.bind("<FocusIn>", self.on_url_focus_in)
@@ -275,11 +927,13 @@ class BookQRGenerator:
         button_frame.columnconfigure(0, weight=1)
         button_frame.columnconfigure(1, weight=1)
         
-        ttk.Button(button_frame, text="Generate QR Code", command=self.generate_qr_from_url).grid(
+        self.url_generate_button = ttk.Button(button_frame, text="Generate QR Code", command=self.generate_qr_from_url)
+        self.url_generate_button.grid(
             row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 5)
         )
         
-        ttk.Button(button_frame, text="Clear", command=self.clear_url_input).grid(
+        self.url_clear_button = ttk.Button(button_frame, text="Clear", command=self.clear_url_input)
+        self.url_clear_button.grid(
             row=0, column=1, sticky=(tk.W, tk.E), padx=(5, 0)
         )
         
@@ -292,40 +946,57 @@ class BookQRGenerator:
         # Canvas for QR code display
         self.url_qr_canvas = tk.Canvas(qr_frame, width=400, height=400, bg="white", relief=tk.SUNKEN, borderwidth=2)
         self.url_qr_canvas.grid(row=0, column=0)
-        
-        # Initial message on canvas
-        self.url_qr_canvas.create_text(
-            200, 200,
-            text="QR code will appear here",
-            fill="gray",
-            font=("TkDefaultFont", 12),
-            tags="placeholder"
-        )
+        self.url_preview = QRPreview(self.url_qr_canvas)
         
         # Save button
-        ttk.Button(self.url_tab, text="Save QR Code", command=self.save_url_qr_code).grid(
-            row=5, column=0, sticky=(tk.W, tk.E), pady=(0, 10)
-        )
+        self.url_save_button = ttk.Button(self.url_tab, text="Save QR Code", command=self.save_url_qr_code)
+        self.url_save_button.grid(row=5, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
+        
+        # Result of the last save, shown inline instead of in a dialog
+        self.url_save_status_label = ttk.Label(self.url_tab, text="", foreground="green")
+        self.url_save_status_label.grid(row=6, column=0, sticky=tk.W)
+    
+    def show_url_placeholder(self):
+        """Replace the URL input contents with the gray placeholder text."""
+        self.url_input.delete("1.0", tk.END)
+        self.url_input.insert("1.0", URL_PLACEHOLDER)
+        self.url_input.config(foreground="gray")
+        self._url_is_placeholder = True
     
     def on_url_focus_in(self, event):
         """Handle focus in event for URL input (remove placeholder)."""
-        if self.url_input.get("1.0", "end-1c") == "https://example.com or any text":
+        if self._url_is_placeholder:
             self.url_input.delete("1.0", tk.END)
             self.url_input.config(foreground="black")
+            self._url_is_placeholder = False
     
     def on_url_focus_out(self, event):
         """Handle focus out event for URL input (restore placeholder if empty)."""
         if not self.url_input.get("1.0", "end-1c").strip():
-            self.url_input.insert("1.0", "https://example.com or any text")
-            self.url_input.config(foreground="gray")
+            self.show_url_placeholder()
     
     def update_char_count(self, event=None):
+        """Schedule a character count update once typing pauses."""
+        if self._char_count_after_id is not None:
+            self.root.after_cancel(self._char_count_after_id)
+        self._char_count_after_id = self.root.after(CHAR_COUNT_DELAY_MS, self._update_char_count_now)
+    
+    def _update_char_count_now(self):
         """Update character count label."""
-        content = self.url_input.get("1.0", "end-1c")
-        if content == "https://example.com or any text":
+        self._char_count_after_id = None
+        
+        # Text typed while the placeholder is still shown (e.g. right after
+        # Clear) replaces it as input
+        if self._url_is_placeholder and self.url_input.get("1.0", "end-1c") != URL_PLACEHOLDER:
+            self.url_input.config(foreground="black")
+            self._url_is_placeholder = False
+        
+        if self._url_is_placeholder:
             count = 0
         else:
-            count = len(content)
+            # Let Tk count the characters instead of copying the text out
+            count = self.url_input.count("1.0", "end-1c", "chars")
+            count = count[0] if count else 0
         self.url_char_count_label.config(text=f"Character Count: {count}")
     
     def validate_url(self, url):
@@ -351,10 +1022,10 @@ class BookQRGenerator:
     def generate_qr_from_url(self):
         """Generate QR code from URL/text input."""
         # Get content from input
-        content = self.url_input.get("1.0", "end-1c")
+        content = "" if self._url_is_placeholder else self.url_input.get("1.0", "end-1c")
         
         # Check if placeholder is still there
-        if content == "https://example.com or any text" or not content.strip():
+        if not content.strip():
             messagebox.showwarning("Warning", "Please enter a URL or text to generate QR code")
             return
         
@@ -374,88 +1045,83 @@ class BookQRGenerator:
             if not response:
                 return
         
-        try:
-            # Generate QR code with high error correction for URLs
-            qr = qrcode.QRCode(
-                version=None,  # Auto-size
-                error_correction=qrcode.constants.ERROR_CORRECT_H,  # High error correction
-                box_size=10,
-                border=4,
-            )
-            qr.add_data(content)
-            qr.make(fit=True)
-            
-            # Create image
-            self.url_qr_image = qr.make_image(fill_color="black", back_color="white")
-            
-            # Display in canvas
-            self.display_url_qr_code()
-            
-            messagebox.showinfo("Success", f"QR code generated successfully!\nContent length: {content_length} characters")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate QR code:\n{str(e)}")
+        # Encode the QR code on a worker thread so the window stays responsive
+        self.set_url_busy(True)
+        self.run_in_background(
+            lambda: self.build_url_qr_code(content),
+            lambda result, error: self._generate_url_qr_done(content_length, result, error)
+        )
     
-    def display_url_qr_code(self):
-        """Display the URL QR code on the canvas."""
-        if not self.url_qr_image:
-            return
+    def build_url_qr_code(self, content):
+        """
+        Encode the URL mode QR code content and render its preview image.
         
-        # Remove placeholder text
-        self.url_qr_canvas.delete("placeholder")
+        Args:
+            content: Text to encode
         
-        # Resize image to fit canvas (max 380x380 to leave some padding)
-        img_width, img_height = self.url_qr_image.size
-        max_size = 380
+        Returns:
+            Tuple of (qr_matrix, preview_image)
+        """
+        matrix = encode_qr_matrix_cached(content, pick_error_correction(len(content.encode("utf-8"))))
+        return matrix, render_preview_image(matrix)
+    
+    def _generate_url_qr_done(self, content_length, result, error):
+        """
+        Display the URL QR code once encoding has finished.
         
-        if img_width > max_size or img_height > max_size:
-            ratio = min(max_size / img_width, max_size / img_height)
-            new_width = int(img_width * ratio)
-            new_height = int(img_height * ratio)
-            display_image = self.url_qr_image.resize((new_width, new_height), Image.LANCZOS)
-        else:
-            display_image = self.url_qr_image
+        Args:
+            content_length: Length of the encoded content
+            result: Tuple of (qr_matrix, preview_image), or None if encoding failed
+            error: Exception raised during encoding, or None
+        """
+        self.set_url_busy(False)
         
-        # Convert to PhotoImage
-        self.url_qr_photo = ImageTk.PhotoImage(display_image)
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to generate QR code:\n{str(error)}")
+            return
         
-        # Clear canvas and display image
-        self.url_qr_canvas.delete("all")
-        canvas_width = self.url_qr_canvas.winfo_width()
-        canvas_height = self.url_qr_canvas.winfo_height()
+        # The preview is canvas sized; the full size image is only rendered
+        # when the QR code is saved
+        self.url_qr_matrix, self.url_qr_image = result
         
-        # If canvas dimensions are not yet set, use defaults
-        if canvas_width <= 1:
-            canvas_width = 400
-        if canvas_height <= 1:
-            canvas_height = 400
+        # Display in canvas
+        self.display_url_qr_code()
         
-        # Center the image
-        x = canvas_width // 2
-        y = canvas_height // 2
-        self.url_qr_canvas.create_image(x, y, image=self.url_qr_photo, anchor=tk.CENTER)
+        messagebox.showinfo("Success", f"QR code generated successfully!\nContent length: {content_length} characters")
+    
+    def set_url_busy(self, busy):
+        """
+        Enable or disable the URL mode buttons around a background job.
+        
+        Args:
+            busy: True while a background job is running
+        """
+        state = tk.DISABLED if busy else tk.NORMAL
+        for button in (self.url_generate_button, self.url_clear_button):
+            button.config(state=state)
+    
+    def display_url_qr_code(self):
+        """Display the URL QR code on the canvas."""
+        if not self.url_qr_image:
+            return
+        
+        self.url_preview.show(self.url_qr_image)
     
     def clear_url_input(self):
         """Clear URL input and reset preview."""
-        self.url_input.delete("1.0", tk.END)
-        self.url_input.insert("1.0", "https://example.com or any text")
-        self.url_input.config(foreground="gray")
+        self.show_url_placeholder()
         
         # Clear QR code
+        self.url_qr_matrix = None
         self.url_qr_image = None
-        self.url_qr_photo = None
         
         # Reset canvas
-        self.url_qr_canvas.delete("all")
-        self.url_qr_canvas.create_text(
-            200, 200,
-            text="QR code will appear here",
-            fill="gray",
-            font=("TkDefaultFont", 12),
-            tags="placeholder"
-        )
+        self.url_preview.show_placeholder()
         
         # Reset character count
+        if self._char_count_after_id is not None:
+            self.root.after_cancel(self._char_count_after_id)
+            self._char_count_after_id = None
         self.url_char_count_label.config(text="Character Count: 0")
     
     def save_url_qr_code(self):
@@ -473,11 +1139,7 @@ class BookQRGenerator:
         )
         
         if file_path:
-            try:
-                self.url_qr_image.save(file_path)
-                messagebox.showinfo("Success", f"QR code saved successfully to:\n{file_path}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save QR code:\n{str(e)}")
+            self.save_in_background(self.url_qr_matrix, file_path, self.url_save_button, self.url_save_status_label)
     
     def browse_pdf(self):
         """Open file dialog to select a PDF file."""
@@ -486,24 +1148,169 @@ class BookQRGenerator:
             filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
         )
         
-        if file_path:
+        if not file_path:
+            return
+        
+        # Release any previously opened document before loading the new one
+        self.close_pdf()
+        self.pdf_path = None
+        
+        # Open the PDF on a worker thread; parsing a large file with pypdf
+        # can take a while
+        self.set_pdf_busy(True)
+        self.run_in_background(
+            lambda: self.load_pdf(file_path),
+            lambda fingerprint, error: self._browse_pdf_done(file_path, fingerprint, error)
+        )
+    
+    def load_pdf(self, file_path):
+        """
+        Open a PDF file and compute its fingerprint.
+        
+        Args:
+            file_path: Path to the PDF file
+        
+        Returns:
+            Fingerprint of the file, see compute_pdf_fingerprint()
+        """
+        self.open_pdf(file_path)
+        return self.compute_pdf_fingerprint(file_path)
+    
+    def _browse_pdf_done(self, file_path, fingerprint, error):
+        """
+        Update the UI once a PDF file has been opened.
+        
+        Args:
+            file_path: Path to the PDF file
+            fingerprint: Fingerprint of the file, or None if opening failed
+            error: Exception raised while opening the file, or None
+        """
+        self.set_pdf_busy(False)
+        
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to load PDF:\n{str(error)}")
+            self.close_pdf()
+            return
+        
+        self.pdf_path = file_path
+        
+        # Cached page text is only valid for the same file contents
+        if fingerprint != self.pdf_fingerprint:
+            self._page_text_cache = LRUCache(PAGE_TEXT_CACHE_SIZE)
+            self.pdf_fingerprint = fingerprint
+        
+        # Update UI
+        filename = os.path.basename(file_path)
+        self.pdf_path_label.config(text=filename, foreground="black")
+        self.pdf_info_label.config(text=f"Total pages: {self.total_pages}")
+        
+        messagebox.showinfo("Success", f"PDF loaded successfully!\nTotal pages: {self.total_pages}")
+    
+    def open_pdf(self, file_path):
+        """
+        Read the page count of a PDF file with the fastest available backend.
+        
+        PyMuPDF is used when installed; otherwise pypdf is used. With
+        PyMuPDF only the page count is read here and the document is opened
+        on first text extraction, so browsing a PDF stays fast. Files that
+        PyMuPDF cannot open are retried with pypdf when it is installed.
+        
+        Args:
+            file_path: Path to the PDF file
+        
+        Raises:
+            ValueError: If the PDF needs a password to be read
+        """
+        if HAS_PYMUPDF:
+            fitz = import_pymupdf()
             try:
-                # Try to open and read the PDF
-                self.pdf_reader = PdfReader(file_path)
-                self.total_pages = len(self.pdf_reader.pages)
-                self.pdf_path = file_path
-                
-                # Update UI
-                filename = os.path.basename(file_path)
-                self.pdf_path_label.config(text=filename, foreground="black")
-                self.pdf_info_label.config(text=f"Total pages: {self.total_pages}")
-                
-                messagebox.showinfo("Success", f"PDF loaded successfully!\nTotal pages: {self.total_pages}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load PDF:\n{str(e)}")
-                self.pdf_path = None
-                self.pdf_reader = None
-                self.total_pages = 0
+                with fitz.open(file_path) as doc:
+                    needs_password = doc.needs_pass
+                    self.total_pages = doc.page_count
+            except Exception:
+                if not HAS_PYPDF:
+                    raise
+            else:
+                # PyMuPDF already tried the empty password, and pypdf cannot
+                # do better without the real one
+                if needs_password:
+                    raise ValueError("The PDF is password protected")
+                self.pdf_backend = "fitz"
+                return
+        
+        # pypdf has to parse the document to count pages, so keep it. The file
+        # may be rewritten while it stays loaded, so it is read into memory
+        # rather than mapped (see open_pdf_reader()).
+        self.pdf_doc = import_pdf_reader()(file_path)
+        self.pdf_backend = "pypdf"
+        
+        # len(pages) walks the whole page tree; the page count stored in
+        # its root is enough here, and pages are loaded on first access
+        try:
+            self.total_pages = int(self.pdf_doc.trailer["/Root"]["/Pages"]["/Count"])
+        except (KeyError, TypeError, ValueError):
+            self.total_pages = len(self.pdf_doc.pages)
+    
+    def get_pdf_doc(self):
+        """
+        Return the document of the loaded PDF, opening it on first use.
+        
+        Returns:
+            PyMuPDF Document or pypdf PdfReader, depending on the backend
+        """
+        if self.pdf_doc is None:
+            if self.pdf_backend == "fitz":
+                self.pdf_doc = import_pymupdf().open(self.pdf_path)
+            else:
+                self.pdf_doc = import_pdf_reader()(self.pdf_path)
+        return self.pdf_doc
+    
+    def compute_pdf_fingerprint(self, file_path):
+        """
+        Compute a fingerprint identifying the contents of a PDF file.
+        
+        The path, size and modification time are enough to tell whether
+        cached page text still belongs to the file, and reading them is
+        O(1) regardless of the file size.
+        
+        Args:
+            file_path: Path to the PDF file
+        
+        Returns:
+            Fingerprint string
+        """
+        st = os.stat(file_path)
+        return f"{os.path.abspath(file_path)}-{st.st_size}-{st.st_mtime_ns}"
+    
+    def close_pdf(self):
+        """Close the currently opened PDF document, if any."""
+        if self.pdf_doc is not None:
+            if self.pdf_backend == "fitz":
+                self.pdf_doc.close()
+            else:
+                # Release the file contents read by the PdfReader
+                self.pdf_doc.stream.close()
+        self.pdf_doc = None
+        self.pdf_backend = None
+        self.total_pages = 0
+    
+    def get_page_text(self, page_num):
+        """
+        Extract the raw text of a single page.
+        
+        Args:
+            page_num: Page number (1-indexed)
+        
+        Returns:
+            Text content of the page (empty string if none)
+        """
+        pdf_doc = self.get_pdf_doc()
+        
+        if self.pdf_backend == "fitz":
+            return pdf_doc.load_page(page_num - 1).get_text("text")
+        
+        # Convert to 0-indexed for pypdf
+        return pdf_doc.pages[page_num - 1].extract_text() or ""
     
     def validate_google_drive_link(self, url):
         """
@@ -544,6 +1351,7 @@ class BookQRGenerator:
     def clear_drive_link(self):
         """Clear the Google Drive link entry field."""
         self.drive_link_entry.delete(0, tk.END)
+        self._schedule_preview()
     
     def parse_page_input(self, page_input):
         """
@@ -553,7 +1361,7 @@ class BookQRGenerator:
             page_input: String containing page number or range (e.g., "5" or "10-15")
         
         Returns:
-            List of page numbers (1-indexed)
+            Range of page numbers (1-indexed)
         
         Raises:
             ValueError: If input is invalid
@@ -562,7 +1370,7 @@ class BookQRGenerator:
         
         # Check if it's a range
         if '-' in page_input:
-            match = re.match(r'^(\d+)\s*-\s*(\d+)$', page_input)
+            match = _RANGE_RE.match(page_input)
             if not match:
                 raise ValueError("Invalid page range format. Use format like '10-15'")
             
@@ -576,7 +1384,7 @@ class BookQRGenerator:
             if end_page > self.total_pages:
                 raise ValueError(f"End page {end_page} exceeds total pages ({self.total_pages})")
             
-            return list(range(start_page, end_page + 1))
+            return range(start_page, end_page + 1)
         else:
             # Single page
             if not page_input.isdigit():
@@ -588,41 +1396,215 @@ class BookQRGenerator:
             if page_num > self.total_pages:
                 raise ValueError(f"Page {page_num} exceeds total pages ({self.total_pages})")
             
-            return [page_num]
+            return range(page_num, page_num + 1)
     
-    def extract_text(self, page_numbers):
+    def page_has_content(self, page_num):
         """
-        Extract text from specified pages.
+        Check whether a page has a content stream at all.
+        
+        This only reads the page dictionary, without decoding anything, so
+        blank pages can be skipped before the expensive text extraction.
+        
+        Args:
+            page_num: Page number (1-indexed)
+        
+        Returns:
+            False if the page has no content stream, True otherwise
+        """
+        pdf_doc = self.get_pdf_doc()
+        
+        if self.pdf_backend == "fitz":
+            kind, value = pdf_doc.xref_get_key(pdf_doc.page_xref(page_num - 1), "Contents")
+            return kind != "null" and value != "[]"
+        
+        contents = pdf_doc.pages[page_num - 1].get("/Contents")
+        if contents is None:
+            return False
+        
+        # An empty array of content streams draws nothing either
+        contents = contents.get_object()
+        return not (isinstance(contents, list) and len(contents) == 0)
+    
+    def process_pool_pays_off(self, page_count):
+        """
+        Estimate whether extracting pages in worker processes is faster.
+        
+        Every pypdf worker has to parse the document again before it can
+        extract anything, which takes longer the more pages the document
+        has, while the loaded reader extracts pages right away.
+        
+        Args:
+            page_count: Number of pages to extract
+        
+        Returns:
+            True if extract_pages_multiprocess() should be used
+        """
+        workers = min(page_count, os.cpu_count() or 1)
+        if workers < 2:
+            return False
+        if self.pdf_backend == "fitz":
+            return page_count >= PROCESS_POOL_MIN_PAGES_FITZ
+        
+        # The workers parse the document at the same time, so the wall time
+        # of that is paid once; the extraction itself is split among them
+        overhead = PROCESS_POOL_STARTUP_MS + PYPDF_PAGE_PARSE_MS * self.total_pages
+        saved = PYPDF_PAGE_EXTRACT_MS * page_count * (1 - 1 / workers)
+        return saved > overhead
+    
+    def extract_pages_multiprocess(self, page_numbers):
+        """
+        Extract the raw text of many pages in a pool of worker processes.
+        
+        Unlike threads, processes can run PyMuPDF in parallel and are not
+        limited by the GIL. Pages are split into one contiguous batch per
+        worker, so each process opens the document only once.
         
         Args:
             page_numbers: List of page numbers (1-indexed)
         
         Returns:
-            Extracted and cleaned text
+            List of page texts in the same order as page_numbers
         """
-        extracted_texts = []
+        from concurrent.futures import ProcessPoolExecutor
         
-        for page_num in page_numbers:
-            # Convert to 0-indexed for pypdf
-            page = self.pdf_reader.pages[page_num - 1]
-            text = page.extract_text()
-            
-            if text:
-                extracted_texts.append(text)
+        max_workers = min(len(page_numbers), os.cpu_count() or 1)
+        batch_size = -(-len(page_numbers) // max_workers)
+        tasks = [
+            (self.pdf_backend, self.pdf_path, page_numbers[i:i + batch_size])
+            for i in range(0, len(page_numbers), batch_size)
+        ]
+        
+        with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+            # map() preserves batch order
+            return [
+                text
+                for batch in executor.map(extract_pages_in_process, tasks)
+                for text in batch
+            ]
+    
+    def get_text_cache_dir(self):
+        """
+        Get the directory holding cached page text of the loaded PDF.
         
-        # Concatenate all texts
-        combined_text = "\n\n".join(extracted_texts)
+        The backends extract slightly different text, so each has its own
+        directory.
+        
+        Returns:
+            Directory path named after the backend and PDF fingerprint, or
+            None if no PDF is loaded
+        """
+        if self.pdf_fingerprint is None:
+            return None
+        key = hashlib.blake2b(
+            f"{self.pdf_backend}\0{self.pdf_fingerprint}".encode("utf-8", "surrogatepass"),
+            digest_size=16
+        ).hexdigest()
+        return os.path.join(TEXT_CACHE_DIR, key)
+    
+    def read_cached_page_text(self, text_cache_dir, page_num):
+        """
+        Read the cleaned text of a page extracted in an earlier session.
+        
+        Args:
+            text_cache_dir: Directory returned by get_text_cache_dir()
+            page_num: Page number (1-indexed)
+        
+        Returns:
+            Cleaned page text, or None if the page is not cached
+        """
+        try:
+            with open(os.path.join(text_cache_dir, f"{page_num}.txt"), "rb") as f:
+                return f.read().decode("utf-8", "surrogatepass")
+        except (OSError, UnicodeDecodeError):
+            return None
+    
+    def extract_text(self, page_numbers):
+        """
+        Extract text from specified pages.
+        
+        Args:
+            page_numbers: Page numbers (1-indexed), e.g. a range
+        
+        Returns:
+            Extracted and cleaned text
         
-        # Clean up text - remove excessive whitespace
-        combined_text = re.sub(r'\s+', ' ', combined_text)
-        combined_text = combined_text.strip()
+        Raises:
+            ValueError: If the PDF file was modified since it was loaded
+        """
+        # Only pages that were not extracted before need to be parsed. The
+        # texts are also collected locally because the cache may evict pages
+        # of a long range before they are joined.
+        page_texts = {}
+        missing_pages = []
+        for page_num in page_numbers:
+            text = self._page_text_cache.get(page_num)
+            if text is None:
+                missing_pages.append(page_num)
+            else:
+                page_texts[page_num] = text
+        
+        # Cached text, the page count and the open document all belong to the
+        # file as it was loaded; a rewritten file has to be loaded again
+        if missing_pages and self.compute_pdf_fingerprint(self.pdf_path) != self.pdf_fingerprint:
+            raise ValueError("The PDF file has changed since it was loaded. Please select it again.")
+        
+        # Pages extracted in an earlier session are read back from disk
+        text_cache_dir = self.get_text_cache_dir()
+        if text_cache_dir is not None and missing_pages:
+            cache_used = False
+            for page_num in missing_pages:
+                text = self.read_cached_page_text(text_cache_dir, page_num)
+                if text is not None:
+                    page_texts[page_num] = self._page_text_cache[page_num] = text
+                    cache_used = True
+            if cache_used:
+                # Mark the entry as used so prune_caches() keeps it
+                try:
+                    os.utime(text_cache_dir)
+                except OSError:
+                    pass
+            missing_pages = [p for p in missing_pages if p not in page_texts]
+        
+        # Pages without a content stream cannot have text
+        blank_pages = [p for p in missing_pages if not self.page_has_content(p)]
+        for page_num in blank_pages:
+            page_texts[page_num] = self._page_text_cache[page_num] = ""
+        if blank_pages:
+            missing_pages = [p for p in missing_pages if p not in page_texts]
+        
+        if self.process_pool_pays_off(len(missing_pages)):
+            texts = self.extract_pages_multiprocess(missing_pages)
+        else:
+            # pypdf holds the GIL while extracting, so threads would take
+            # turns and each would have to parse the document again; the
+            # open document is faster. Pages are extracted one at a time as
+            # the loop below consumes them.
+            texts = (self.get_page_text(p) for p in missing_pages)
+        
+        # Clean up each page as it comes in - collapse runs of whitespace
+        # (split() also drops leading and trailing whitespace). The cleaned
+        # text is what gets cached, so no large uncleaned string is built.
+        for page_num, text in zip(missing_pages, texts):
+            page_texts[page_num] = self._page_text_cache[page_num] = " ".join(text.split())
+        
+        if text_cache_dir is not None:
+            for page_num in blank_pages + missing_pages:
+                write_cache_file(
+                    os.path.join(text_cache_dir, f"{page_num}.txt"),
+                    page_texts[page_num].encode("utf-8", "surrogatepass")
+                )
         
-        return combined_text
+        # Pages that yield no text are skipped
+        return " ".join(
+            page_texts[page_num]
+            for page_num in page_numbers
+            if page_texts[page_num]
+        )
     
     def generate_qr(self):
         """Generate QR code from extracted text."""
         # Validate PDF is loaded
-        if not self.pdf_reader:
+        if self.pdf_path is None:
             messagebox.showwarning("Warning", "Please select a PDF file first")
             return
         
@@ -650,73 +1632,226 @@ class BookQRGenerator:
                 if not response:
                     return
         
-        # Extract text
-        try:
-            self.extracted_text = self.extract_text(page_numbers)
-            
-            if not self.extracted_text:
-                messagebox.showwarning(
-                    "Warning",
-                    "No text could be extracted from the specified page(s).\n"
-                    "The page(s) might be empty or contain only images."
-                )
+        # Extract text on a worker thread so the window stays responsive
+        self.set_pdf_busy(True)
+        self.run_in_background(
+            lambda: self.extract_text(page_numbers),
+            lambda text, error: self._extract_text_done(page_numbers, drive_link, text, error)
+        )
+    
+    def _extract_text_done(self, page_numbers, drive_link, text, error):
+        """
+        Continue QR generation once text extraction has finished.
+        
+        Args:
+            page_numbers: Page numbers the text was extracted from
+            drive_link: Google Drive link to include (may be empty)
+            text: Extracted text, or None if extraction failed
+            error: Exception raised during extraction, or None
+        """
+        if error is not None:
+            self.set_pdf_busy(False)
+            messagebox.showerror("Error", f"Failed to generate QR code:\n{str(error)}")
+            return
+        
+        self.extracted_text = text
+        
+        if not self.extracted_text:
+            self.set_pdf_busy(False)
+            messagebox.showwarning(
+                "Warning",
+                "No text could be extracted from the specified page(s).\n"
+                "The page(s) might be empty or contain only images."
+            )
+            return
+        
+        # Add Google Drive link if provided. The full content is only built
+        # on the worker thread, right before encoding.
+        link_portion = f"{DRIVE_LINK_PREFIX}{drive_link}" if drive_link else ""
+        self.google_drive_link = drive_link
+        
+        # Check text length (QR codes have limitations)
+        text = self.extracted_text
+        text_length = len(text) + len(link_portion)
+        
+        # QR code can typically hold up to ~4296 characters (with low error correction)
+        # We'll use a more conservative limit
+        if text_length > 2000:
+            response = messagebox.askyesno(
+                "Large Text Warning",
+                f"The combined content is very large ({text_length} characters).\n"
+                "QR codes work best with smaller amounts of text.\n"
+                "The QR code may be difficult to scan.\n\n"
+                "Do you want to continue anyway?"
+            )
+            if not response:
+                self.set_pdf_busy(False)
                 return
-            
-            # Prepare QR code content
-            qr_content = self.extracted_text
-            
-            # Add Google Drive link if provided
-            if drive_link:
-                qr_content = f"{self.extracted_text}\n\n---\nGoogle Drive Link: {drive_link}"
-                self.google_drive_link = drive_link
-            else:
-                self.google_drive_link = ""
-            
-            # Check text length (QR codes have limitations)
-            text_length = len(qr_content)
-            
-            # QR code can typically hold up to ~4296 characters (with low error correction)
-            # We'll use a more conservative limit
-            if text_length > 2000:
-                response = messagebox.askyesno(
-                    "Large Text Warning",
-                    f"The combined content is very large ({text_length} characters).\n"
-                    "QR codes work best with smaller amounts of text.\n"
-                    "The QR code may be difficult to scan.\n\n"
-                    "Do you want to continue anyway?"
-                )
-                if not response:
-                    return
-            
-            # Update text info
-            page_range_str = f"Page {page_numbers[0]}" if len(page_numbers) == 1 else f"Pages {page_numbers[0]}-{page_numbers[-1]}"
-            
-            # Calculate breakdown for display
-            if drive_link:
-                text_only_length = len(self.extracted_text)
-                # Calculate the link portion including formatting
-                link_portion = f"\n\n---\nGoogle Drive Link: {drive_link}"
-                link_length = len(link_portion)
-                self.text_info_label.config(
-                    text=f"Text: {text_only_length} chars | Link: {link_length} chars | Total: {text_length} characters"
-                )
-            else:
-                self.text_info_label.config(
-                    text=f"Text extracted from {page_range_str}: {text_length} characters"
-                )
-            
-            # Generate QR code
-            qr = qrcode.QRCode(
-                version=None,  # Auto-size
-                error_correction=qrcode.constants.ERROR_CORRECT_L,  # Low error correction for more data
-                box_size=10,
-                border=4,
+        
+        # Update text info
+        page_range_str = self.update_text_info(page_numbers, drive_link, text_length)
+        
+        # Encode the QR code on a worker thread as well
+        self.run_in_background(
+            lambda: self.build_pdf_qr_code(text + link_portion),
+            lambda result, error: self._generate_qr_done(drive_link, text_length, page_range_str, result, error)
+        )
+    
+    def update_text_info(self, page_numbers, drive_link, text_length):
+        """
+        Show the character count breakdown of the current QR code content.
+        
+        Args:
+            page_numbers: Page numbers the text was extracted from
+            drive_link: Google Drive link included in the content (may be empty)
+            text_length: Total length of the QR code content
+        
+        Returns:
+            Human readable description of the page selection
+        """
+        page_range_str = f"Page {page_numbers[0]}" if len(page_numbers) == 1 else f"Pages {page_numbers[0]}-{page_numbers[-1]}"
+        
+        # Calculate breakdown for display
+        if drive_link:
+            text_only_length = len(self.extracted_text)
+            # Length of the link portion including formatting
+            link_length = len(DRIVE_LINK_PREFIX) + len(drive_link)
+            self.text_info_label.config(
+                text=f"Text: {text_only_length} chars | Link: {link_length} chars | Total: {text_length} characters"
             )
-            qr.add_data(qr_content)
-            qr.make(fit=True)
-            
-            # Create image
-            self.qr_image = qr.make_image(fill_color="black", back_color="white")
+        else:
+            self.text_info_label.config(
+                text=f"Text extracted from {page_range_str}: {text_length} characters"
+            )
+        
+        return page_range_str
+    
+    def _schedule_preview(self, event=None):
+        """
+        Preview the QR code once the page selection or link stops changing.
+        
+        Every edit restarts the delay, so a burst of keystrokes results in a
+        single preview.
+        """
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(250, self._preview_qr)
+    
+    def _preview_qr(self):
+        """
+        Re-render the QR code for the current page selection without prompts.
+        
+        The preview only runs when every selected page is already in the
+        page-text cache, so the PDF is never parsed while typing. Selections
+        that would need a confirmation (non-Google links, large content) are
+        left to the Generate QR Code button.
+        """
+        self._preview_after_id = None
+        
+        if self.pdf_path is None:
+            return
+        
+        # Catch up with edits made while a job was running once it is done
+        if self._pdf_busy:
+            self._preview_pending = True
+            return
+        
+        try:
+            page_numbers = self.parse_page_input(self.page_entry.get())
+        except ValueError:
+            return
+        
+        if not all(page_num in self._page_text_cache for page_num in page_numbers):
+            return
+        
+        drive_link = self.drive_link_entry.get().strip()
+        is_valid, warning_message = self.validate_google_drive_link(drive_link)
+        if not is_valid or warning_message:
+            return
+        
+        # Served entirely from the page-text cache
+        text = self.extract_text(page_numbers)
+        if not text:
+            return
+        
+        link_portion = f"{DRIVE_LINK_PREFIX}{drive_link}" if drive_link else ""
+        text_length = len(text) + len(link_portion)
+        if text_length > 2000:
+            return
+        
+        # The QR code for this content is already shown
+        if self.qr_matrix is not None and text == self.extracted_text and drive_link == self.google_drive_link:
+            return
+        
+        self.set_pdf_busy(True)
+        self.run_in_background(
+            lambda: self.build_pdf_qr_code(text + link_portion),
+            lambda result, error: self._preview_qr_done(page_numbers, drive_link, text, text_length, result, error)
+        )
+    
+    def _preview_qr_done(self, page_numbers, drive_link, text, text_length, result, error):
+        """
+        Display a previewed QR code once encoding has finished.
+        
+        Args:
+            page_numbers: Page numbers the text was extracted from
+            drive_link: Google Drive link included in the QR code (may be empty)
+            text: Extracted text encoded in the QR code
+            text_length: Total length of the encoded content
+            result: Tuple of (qr_matrix, preview_image), or None if encoding failed
+            error: Exception raised during encoding, or None
+        """
+        self.set_pdf_busy(False)
+        
+        if error is not None:
+            return
+        
+        self.extracted_text = text
+        self.google_drive_link = drive_link
+        self.qr_matrix, self.qr_image = result
+        self.update_text_info(page_numbers, drive_link, text_length)
+        self.display_qr_code()
+    
+    def build_pdf_qr_code(self, qr_content):
+        """
+        Encode the PDF mode QR code content and render its preview image.
+        
+        Args:
+            qr_content: Text to encode
+        
+        Returns:
+            Tuple of (qr_matrix, preview_image)
+        """
+        matrix = encode_qr_matrix_cached(qr_content, pick_error_correction(len(qr_content.encode("utf-8"))))
+        return matrix, render_preview_image(matrix)
+    
+    def _generate_qr_done(self, drive_link, text_length, page_range_str, result, error):
+        """
+        Display the generated QR code once encoding has finished.
+        
+        Args:
+            drive_link: Google Drive link included in the QR code (may be empty)
+            text_length: Total length of the encoded content
+            page_range_str: Human readable description of the page selection
+            result: Tuple of (qr_matrix, preview_image), or None if encoding failed
+            error: Exception raised during encoding, or None
+        """
+        self.set_pdf_busy(False)
+        
+        if isinstance(error, DataOverflowError):
+            messagebox.showerror(
+                "Error",
+                "The content is too large to fit in a QR code.\n"
+                f"A QR code can hold at most about {QR_MAX_BYTES} bytes of text.\n"
+                "Try selecting fewer pages."
+            )
+            return
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to generate QR code:\n{str(error)}")
+            return
+        
+        try:
+            self.qr_matrix, self.qr_image = result
             
             # Display in canvas
             self.display_qr_code()
@@ -733,44 +1868,88 @@ class BookQRGenerator:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate QR code:\n{str(e)}")
     
-    def display_qr_code(self):
-        """Display the QR code on the canvas."""
-        if not self.qr_image:
-            return
+    def run_in_background(self, work, on_done):
+        """
+        Run a function on a worker thread and report back on the Tk thread.
         
-        # Remove placeholder text
-        self.qr_canvas.delete("placeholder")
+        Tk widgets must only be touched from the main thread, so the worker
+        puts its outcome on a queue that is polled with root.after().
         
-        # Resize image to fit canvas (max 380x380 to leave some padding)
-        img_width, img_height = self.qr_image.size
-        max_size = 380
+        Args:
+            work: Callable taking no arguments that performs the heavy work
+            on_done: Callable invoked as on_done(result, error) on the Tk thread
+        """
+        def worker():
+            try:
+                self._task_queue.put((on_done, work(), None))
+            except Exception as e:
+                self._task_queue.put((on_done, None, e))
         
-        if img_width > max_size or img_height > max_size:
-            ratio = min(max_size / img_width, max_size / img_height)
-            new_width = int(img_width * ratio)
-            new_height = int(img_height * ratio)
-            display_image = self.qr_image.resize((new_width, new_height), Image.LANCZOS)
-        else:
-            display_image = self.qr_image
+        threading.Thread(target=worker, daemon=True).start()
         
-        # Convert to PhotoImage
-        self.qr_photo = ImageTk.PhotoImage(display_image)
+        self._pending_tasks += 1
+        # A single polling chain serves all tasks, including ones started by
+        # on_done callbacks while the queue is being polled
+        if not self._polling:
+            self._polling = True
+            self.root.after(50, self._poll_task_queue)
+    
+    def _poll_task_queue(self):
+        """Dispatch results of finished background tasks."""
+        try:
+            while True:
+                try:
+                    on_done, result, error = self._task_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._pending_tasks -= 1
+                # A failing callback must not keep the other results (or
+                # later tasks) from being delivered
+                try:
+                    on_done(result, error)
+                except Exception as e:
+                    messagebox.showerror("Error", f"An unexpected error occurred:\n{str(e)}")
+        finally:
+            # Always re-arm or stop the chain, so run_in_background() starts
+            # a new one once this one has ended
+            if self._pending_tasks > 0:
+                self.root.after(50, self._poll_task_queue)
+            else:
+                self._polling = False
+    
+    def set_pdf_busy(self, busy):
+        """
+        Show or hide the PDF mode progress indicator.
         
-        # Clear canvas and display image
-        self.qr_canvas.delete("all")
-        canvas_width = self.qr_canvas.winfo_width()
-        canvas_height = self.qr_canvas.winfo_height()
+        While busy, the buttons that would change the loaded PDF or start
+        another generation are disabled to prevent re-entry.
         
-        # If canvas dimensions are not yet set, use defaults
-        if canvas_width <= 1:
-            canvas_width = 400
-        if canvas_height <= 1:
-            canvas_height = 400
+        Args:
+            busy: True while a background job is running
+        """
+        self._pdf_busy = busy
         
-        # Center the image
-        x = canvas_width // 2
-        y = canvas_height // 2
-        self.qr_canvas.create_image(x, y, image=self.qr_photo, anchor=tk.CENTER)
+        state = tk.DISABLED if busy else tk.NORMAL
+        for button in (self.browse_button, self.generate_button, self.clear_button):
+            button.config(state=state)
+        
+        if busy:
+            self.progress_bar.grid()
+            self.progress_bar.start(10)
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.grid_remove()
+            
+            if self._preview_pending:
+                self._preview_pending = False
+                self._schedule_preview()
+    
+    def display_qr_code(self):
+        """Display the QR code on the canvas."""
+        if not self.qr_image:
+            return
+        
+        self.pdf_preview.show(self.qr_image)
     
     def save_qr(self):
         """Save the QR code to a file."""
@@ -786,19 +1965,133 @@ class BookQRGenerator:
         )
         
         if file_path:
-            try:
-                self.qr_image.save(file_path)
-                messagebox.showinfo("Success", f"QR code saved successfully to:\n{file_path}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save QR code:\n{str(e)}")
+            self.save_in_background(self.qr_matrix, file_path, self.save_button, self.save_status_label)
+    
+    def save_in_background(self, matrix, file_path, button, status_label):
+        """
+        Write a QR code file on a worker thread so a slow disk does not
+        freeze the window.
+        
+        Args:
+            matrix: Module matrix as returned by encode_qr_matrix()
+            file_path: Destination file path
+            button: Save button of the tab, disabled until the save is done
+            status_label: Status label of the tab, see show_save_status()
+        """
+        button.config(state=tk.DISABLED)
+        self.run_in_background(
+            lambda: self.write_qr_file(matrix, file_path),
+            lambda result, error: self._save_done(file_path, button, status_label, error)
+        )
+    
+    def _save_done(self, file_path, button, status_label, error):
+        """
+        Report the outcome of a background save.
+        
+        Args:
+            file_path: Path the QR code was saved to
+            button: Save button to enable again
+            status_label: Status label of the tab
+            error: Exception raised while saving, or None
+        """
+        button.config(state=tk.NORMAL)
+        
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to save QR code:\n{str(error)}")
+            return
+        
+        self.show_save_status(status_label, file_path)
+    
+    def show_save_status(self, label, file_path):
+        """
+        Briefly show where a QR code was saved, without a modal dialog.
+        
+        Args:
+            label: Status label of the tab the QR code was saved from
+            file_path: Path the QR code was saved to
+        """
+        label.config(text=f"Saved: {file_path}")
+        
+        # Restart the timeout if the label is already showing a message
+        after_id = self._save_status_after_ids.pop(str(label), None)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+        self._save_status_after_ids[str(label)] = self.root.after(
+            SAVE_STATUS_TIMEOUT_MS, lambda: self._clear_save_status(label)
+        )
+    
+    def _clear_save_status(self, label):
+        """
+        Hide the save status message once its timeout has passed.
+        
+        Args:
+            label: Status label to clear
+        """
+        self._save_status_after_ids.pop(str(label), None)
+        label.config(text="")
+    
+    def get_qr_png_bytes(self, matrix):
+        """
+        Get the full resolution PNG file of a QR code.
+        
+        The PNG of the most recently saved QR code is kept, so saving the
+        same code again (e.g. to another location) does not encode it again.
+        
+        Args:
+            matrix: Module matrix as returned by encode_qr_matrix()
+        
+        Returns:
+            PNG file contents
+        """
+        # The matrix itself is kept, so a new matrix can never match. Saves
+        # run on worker threads, so the attribute is only read once.
+        saved_png = self._saved_png
+        if saved_png is None or saved_png[0] is not matrix:
+            saved_png = self._saved_png = (matrix, qr_to_png_bytes(matrix, SAVE_BOX_SIZE))
+        return saved_png[1]
+    
+    def write_qr_file(self, matrix, file_path):
+        """
+        Write a full resolution QR code image (the preview is canvas sized).
+        
+        PNG files are encoded directly; other formats chosen through the
+        file name extension are written by Pillow.
+        
+        Args:
+            matrix: Module matrix as returned by encode_qr_matrix()
+            file_path: Destination file path
+        """
+        if file_path.lower().endswith(".png"):
+            # A buffered file writes everything or raises; an unbuffered
+            # write may stop short and leave a truncated image
+            with open(file_path, "wb") as f:
+                f.write(self.get_qr_png_bytes(matrix))
+        else:
+            from PIL import Image
+            
+            # Check the format before the file is created
+            extension = os.path.splitext(file_path)[1].lower()
+            image_format = Image.registered_extensions().get(extension)
+            if image_format is None:
+                raise ValueError(f"unknown file extension: {extension}")
+            
+            image = render_qr_image(matrix, SAVE_BOX_SIZE)
+            # Pillow writes in small pieces; collect them in a large buffer
+            with open(file_path, "wb", buffering=SAVE_BUFFER_SIZE) as f:
+                image.save(f, format=image_format)
     
     def clear_form(self):
         """Clear the form and reset to initial state."""
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
+        
+        self.close_pdf()
         self.pdf_path = None
-        self.pdf_reader = None
-        self.total_pages = 0
+        self.pdf_fingerprint = None
+        self._page_text_cache = LRUCache(PAGE_TEXT_CACHE_SIZE)
+        self.qr_matrix = None
         self.qr_image = None
-        self.qr_photo = None
         self.extracted_text = ""
         self.google_drive_link = ""
         
@@ -810,14 +2103,7 @@ class BookQRGenerator:
         self.text_info_label.config(text="No text extracted yet")
         
         # Clear canvas
-        self.qr_canvas.delete("all")
-        self.qr_canvas.create_text(
-            200, 200,
-            text="QR code will appear here",
-            fill="gray",
-            font=("TkDefaultFont", 12),
-            tags="placeholder"
-        )
+        self.pdf_preview.show_placeholder()
 
 
 def main():
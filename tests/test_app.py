@@ -0,0 +1,88 @@
+"""Tests for the QR code helpers in app.py."""
+
+import unittest
+from io import BytesIO
+from unittest import mock
+
+from PIL import Image, ImageChops
+
+import app
+
+
+class LRUCacheTests(unittest.TestCase):
+    """Tests for LRUCache."""
+    
+    def test_evicts_least_recently_set(self):
+        cache = app.LRUCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["c"] = 3
+        self.assertEqual(list(cache), ["b", "c"])
+    
+    def test_get_marks_recently_used(self):
+        cache = app.LRUCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        self.assertEqual(cache.get("a"), 1)
+        cache["c"] = 3
+        self.assertEqual(list(cache), ["a", "c"])
+        self.assertIsNone(cache.get("b"))
+    
+    def test_overwrite_marks_recently_used(self):
+        cache = app.LRUCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["a"] = 10
+        cache["c"] = 3
+        self.assertEqual(dict(cache), {"a": 10, "c": 3})
+
+
+class QRToPNGBytesTests(unittest.TestCase):
+    """Tests for qr_to_png_bytes()."""
+    
+    def setUp(self):
+        self.matrix = app.encode_qr_matrix("https://example.com/book", "M")
+    
+    def test_matches_render_qr_image(self):
+        # Box sizes covering rows that do and do not end on a byte boundary
+        for box_size in (1, 3, 8, app.SAVE_BOX_SIZE):
+            for has_numpy in (app.HAS_NUMPY, False):
+                with self.subTest(box_size=box_size, numpy=has_numpy), \
+                        mock.patch.object(app, "HAS_NUMPY", has_numpy):
+                    with Image.open(BytesIO(app.qr_to_png_bytes(self.matrix, box_size))) as png:
+                        png.load()
+                    expected = app.render_qr_image(self.matrix, box_size)
+                    
+                    self.assertEqual(png.mode, "1")
+                    self.assertEqual(png.size, expected.size)
+                    self.assertIsNone(ImageChops.difference(png.convert("L"), expected.convert("L")).getbbox())
+
+
+class PickErrorCorrectionTests(unittest.TestCase):
+    """Tests for pick_error_correction()."""
+    
+    def test_tiers(self):
+        self.assertEqual(app.pick_error_correction(100), "H")
+        self.assertEqual(app.pick_error_correction(101), "Q")
+        self.assertEqual(app.pick_error_correction(1000), "M")
+        self.assertEqual(app.pick_error_correction(1001), "L")
+    
+    def test_multibyte_content_fits(self):
+        # 950 characters but 2,850 UTF-8 bytes: only fits at level L
+        content = "ก" * 950
+        error = app.pick_error_correction(len(content.encode("utf-8")))
+        self.assertEqual(error, "L")
+        
+        for has_segno in (True, False):
+            with self.subTest(segno=has_segno), mock.patch.object(app, "HAS_SEGNO", has_segno):
+                matrix = app.encode_qr_matrix(content, error)
+                # Version 40 plus a 4 module border on each side
+                self.assertEqual(len(matrix), 177 + 8)
+    
+    def test_overflow(self):
+        with self.assertRaises(app.DataOverflowError):
+            app.encode_qr_matrix("ก" * (app.QR_MAX_BYTES // 3 + 1), "L")
+
+
+if __name__ == "__main__":
+    unittest.main()